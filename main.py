@@ -2,16 +2,23 @@ import os
 import sys
 import logging
 import argparse
-import shutil
+import hashlib
+import json
+import re
+import socket
+import socketserver
+import stat
+import time
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple
 from dotenv import load_dotenv
-import pickle
 
-import google_auth_oauthlib.flow
-from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+import google_auth_httplib2
+import httplib2
 import googleapiclient.discovery
 import googleapiclient.errors
 
@@ -30,7 +37,9 @@ def ensure_env_file():
     
     if not os.path.exists(env_file):
         if os.path.exists(env_example):
-            shutil.copy(env_example, env_file)
+            # Plain content copy; file metadata doesn't need to carry over
+            with open(env_example, 'rb', buffering=1 << 16) as src, open(env_file, 'wb', buffering=1 << 16) as dst:
+                dst.write(src.read())
             logger.info(f"Created {env_file} from {env_example}")
             logger.info(f"Please edit {env_file} with your configuration before running again")
             sys.exit(0)
@@ -38,10 +47,54 @@ def ensure_env_file():
             logger.error(f"Neither {env_file} nor {env_example} found")
             sys.exit(1)
 
-ensure_env_file()
 
-# Load environment variables
-load_dotenv()
+# Whether .env has already been loaded into this process
+_ENV_LOADED = False
+
+
+def _load_env_once():
+    """Create and load .env at most once per process"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    ensure_env_file()
+    load_dotenv(override=False)
+    _ENV_LOADED = True
+
+
+# Buffer size for reading and writing the saved OAuth token
+TOKEN_BUFFER_SIZE = 1 << 16
+
+# HTTP cache directory and request timeout (seconds) for YouTube API calls
+HTTP_CACHE_DIR = '.httpcache'
+HTTP_TIMEOUT = 30
+
+# Local cache of the service letter -> stream auto-mapping
+STREAM_MAP_CACHE_FILE = 'stream_map.json'
+
+# Default unix socket used by --serve mode and by clients looking for a daemon
+DEFAULT_SOCKET_PATH = '.yt-schedule.sock'
+
+# Seconds to wait for the daemon to accept a connection, and to finish a command
+DAEMON_CONNECT_TIMEOUT = 5
+DAEMON_REPLY_TIMEOUT = 600
+
+# Settings that must match between a client and the daemon it forwards to
+# (DRY_RUN is excluded because dry runs never go to the daemon; SERVICE_* settings are included separately)
+CONFIG_KEYS = (
+    'OAUTH2_CREDENTIALS_FILE', 'CHANNEL_ID', 'PLAYLIST_ID', 'CAMPUS_NAME', 'TIMEZONE',
+    'PRIVACY_STATUS', 'MADE_FOR_KIDS', 'AUTO_START', 'AUTO_STOP', 'ENABLE_DVR',
+    'ENABLE_360', 'ENABLED_SERVICES', 'STREAM_MAP_TTL',
+)
+
+
+def config_fingerprint(env) -> str:
+    """Hash the scheduling configuration in an environment mapping"""
+    items = sorted(
+        (key, value) for key, value in env.items()
+        if key in CONFIG_KEYS or key.startswith('SERVICE_')
+    )
+    return hashlib.sha256(json.dumps(items).encode()).hexdigest()
 
 
 @dataclass
@@ -64,53 +117,104 @@ class YouTubeStreamScheduler:
         'FRIDAY': 4, 'SATURDAY': 5, 'SUNDAY': 6
     }
     
+    # Service time format: HH:MM (24-hour)
+    _TIME_RE = re.compile(r'^(\d{1,2}):(\d{2})$')
+    
+    # Maximum number of calls the YouTube API accepts in one HTTP batch request
+    MAX_BATCH_SIZE = 50
+    
     def __init__(self, weeks: Optional[int] = None):
         """Initialize the scheduler with configuration from environment"""
-        self.oauth2_credentials_file = os.getenv('OAUTH2_CREDENTIALS_FILE')
-        self.channel_id = os.getenv('CHANNEL_ID')
-        self.playlist_id = os.getenv('PLAYLIST_ID')
-        self.campus_name = os.getenv('CAMPUS_NAME', 'Fishers')
-        self.timezone = ZoneInfo(os.getenv('TIMEZONE', 'America/Indianapolis'))
-        self.privacy_status = os.getenv('PRIVACY_STATUS', 'unlisted')
-        self.made_for_kids = os.getenv('MADE_FOR_KIDS', 'false').lower() == 'true'
-        self.auto_start = os.getenv('AUTO_START', 'true').lower() == 'true'
-        self.auto_stop = os.getenv('AUTO_STOP', 'true').lower() == 'true'
-        self.enable_dvr = os.getenv('ENABLE_DVR', 'true').lower() == 'true'
-        self.enable_360 = os.getenv('ENABLE_360', 'false').lower() == 'true'
-        self.dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
+        _load_env_once()
+        
+        # Snapshot the environment once instead of querying it per setting
+        env = dict(os.environ)
+        
+        self.oauth2_credentials_file = env.get('OAUTH2_CREDENTIALS_FILE')
+        self.channel_id = env.get('CHANNEL_ID')
+        self.playlist_id = env.get('PLAYLIST_ID')
+        self.campus_name = env.get('CAMPUS_NAME', 'Fishers')
+        # Whitespace around the letter and a lowercase letter are accepted, as before
+        self._stream_re = re.compile(rf"^{re.escape(self.campus_name)} Stream \s*([A-Ha-h])\s*$")
+        self.timezone = ZoneInfo(env.get('TIMEZONE', 'America/Indianapolis'))
+        self.privacy_status = env.get('PRIVACY_STATUS', 'unlisted')
+        self.made_for_kids = env.get('MADE_FOR_KIDS', 'false').lower() == 'true'
+        self.auto_start = env.get('AUTO_START', 'true').lower() == 'true'
+        self.auto_stop = env.get('AUTO_STOP', 'true').lower() == 'true'
+        self.enable_dvr = env.get('ENABLE_DVR', 'true').lower() == 'true'
+        self.enable_360 = env.get('ENABLE_360', 'false').lower() == 'true'
+        self.dry_run = env.get('DRY_RUN', 'false').lower() == 'true'
+        stream_map_ttl = env.get('STREAM_MAP_TTL', '86400').strip()
+        # None marks an invalid value; validate_config reports it and the cache stays disabled
+        self.stream_map_ttl = int(stream_map_ttl) if stream_map_ttl.isdigit() else None
+        
+        # Lets a daemon detect clients whose configuration differs from its own
+        self.config_fingerprint = config_fingerprint(env)
         
         # Parse enabled services
-        enabled_services_str = os.getenv('ENABLED_SERVICES', '')
+        enabled_services_str = env.get('ENABLED_SERVICES', '')
         self.enabled_service_names = [s.strip().upper() for s in enabled_services_str.split(',') if s.strip()]
         
         # Load service configurations from environment
-        self.services = self._load_service_configs()
+        self.services = self._load_service_configs(env)
+        
+        # Request body parts that are identical for every broadcast (never mutated)
+        self._status_tpl = {
+            "privacyStatus": self.privacy_status,
+            "selfDeclaredMadeForKids": self.made_for_kids,
+        }
+        self._content_details_tpl = {
+            "enableAutoStart": self.auto_start,
+            "enableAutoStop": self.auto_stop,
+            "enableDvr": self.enable_dvr,
+            "projection": "360" if self.enable_360 else "rectangular",
+        }
+        self._playlist_tpl_snippet = {
+            "playlistId": self.playlist_id,
+            "position": 0,
+            "resourceId": {"kind": "youtube#video"},
+        }
         
         # Handle weeks parameter
+        self.set_weeks(weeks)
+        
+        self.youtube = None
+        self.existing_streams = []
+        self.stream_mapping = {}  # Will map service letter to stream object
+        self.stream_mapping_cached = False  # True when stream_mapping came from stream_map.json
+    
+    def set_weeks(self, weeks: Optional[int] = None):
+        """Set the scheduling date range from a number of weeks (None for next occurrence only)"""
+        # Reference time shared by every date calculation for this run
+        self._now = datetime.now(self.timezone)
+        
         if weeks is not None and weeks > 0:
             # Calculate date range from weeks argument
-            now = datetime.now(self.timezone)
-            self.start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            self.start_date = self._now.replace(hour=0, minute=0, second=0, microsecond=0)
             self.end_date = self.start_date + timedelta(weeks=weeks)
             logger.info(f"Scheduling {weeks} week(s) of services")
         else:
             # No weeks specified, schedule next occurrence only
             self.start_date = None
             self.end_date = None
-        
-        self.youtube = None
-        self.existing_streams = []
-        self.stream_mapping = {}  # Will map service letter to stream object
     
-    def _load_service_configs(self) -> Dict[str, ServiceConfig]:
-        """Load service configurations from environment variables"""
+    def _load_service_configs(self, env: Dict[str, str]) -> Dict[str, ServiceConfig]:
+        """Load service configurations from an environment snapshot"""
+        service_env = frozenset((key, value) for key, value in env.items() if key.startswith('SERVICE_'))
+        return dict(self._parse_service_configs(service_env))
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _parse_service_configs(cls, service_env: frozenset) -> Dict[str, ServiceConfig]:
+        """Parse SERVICE_* settings into service configurations (memoized per distinct setting set)"""
+        env = dict(service_env)
         services = {}
         
         for service_id in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            name = os.getenv(f'SERVICE_{service_id}_NAME')
-            day_str = os.getenv(f'SERVICE_{service_id}_DAY', '').strip().upper()
-            time_str = os.getenv(f'SERVICE_{service_id}_TIME', '').strip()
-            description = os.getenv(f'SERVICE_{service_id}_DESCRIPTION', '').strip()
+            name = env.get(f'SERVICE_{service_id}_NAME')
+            day_str = env.get(f'SERVICE_{service_id}_DAY', '').strip().upper()
+            time_str = env.get(f'SERVICE_{service_id}_TIME', '').strip()
+            description = env.get(f'SERVICE_{service_id}_DESCRIPTION', '').strip()
             
             # Skip if essential config is missing
             if not name:
@@ -118,18 +222,17 @@ class YouTubeStreamScheduler:
             
             # Parse day of week
             day_of_week = None
-            if day_str and day_str in self.DAY_MAPPING:
-                day_of_week = self.DAY_MAPPING[day_str]
+            if day_str and day_str in cls.DAY_MAPPING:
+                day_of_week = cls.DAY_MAPPING[day_str]
             
             # Parse time
             time_hour = None
             time_minute = None
-            if time_str and ':' in time_str:
-                try:
-                    time_parts = time_str.split(':')
-                    time_hour = int(time_parts[0])
-                    time_minute = int(time_parts[1])
-                except (ValueError, IndexError):
+            if time_str:
+                match = cls._TIME_RE.match(time_str)
+                if match and int(match[1]) < 24 and int(match[2]) < 60:
+                    time_hour, time_minute = int(match[1]), int(match[2])
+                else:
                     logger.warning(f"Invalid time format for SERVICE_{service_id}_TIME: {time_str}")
             
             # Create service config
@@ -159,6 +262,9 @@ class YouTubeStreamScheduler:
         if not self.playlist_id:
             errors.append("PLAYLIST_ID is required")
             
+        if self.stream_map_ttl is None:
+            errors.append("STREAM_MAP_TTL must be a whole number of seconds")
+            
         if not self.enabled_service_names:
             errors.append("ENABLED_SERVICES is required")
             
@@ -183,19 +289,20 @@ class YouTubeStreamScheduler:
         """Authenticate with YouTube API using persistent token"""
         try:
             scopes = ["https://www.googleapis.com/auth/youtube.force-ssl"]
-            token_file = "token.pickle"
+            token_file = "token.json"
             credentials = None
             
             # Load saved credentials if they exist
             if os.path.exists(token_file):
                 logger.info("Loading saved credentials...")
-                with open(token_file, 'rb') as token:
-                    credentials = pickle.load(token)
+                with open(token_file, 'r', buffering=TOKEN_BUFFER_SIZE) as token:
+                    credentials = Credentials.from_authorized_user_info(json.load(token), scopes)
             
             # If credentials don't exist or are invalid, get new ones
             if not credentials or not credentials.valid:
                 if credentials and credentials.expired and credentials.refresh_token:
                     logger.info("Refreshing expired credentials...")
+                    from google.auth.transport.requests import Request
                     try:
                         credentials.refresh(Request())
                         logger.info("Credentials refreshed successfully")
@@ -205,55 +312,131 @@ class YouTubeStreamScheduler:
                 
                 if not credentials:
                     logger.info("Authenticating with YouTube API (browser will open)...")
-                    flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file(
+                    # Only needed for the interactive flow, so imported on demand
+                    from google_auth_oauthlib.flow import InstalledAppFlow
+                    flow = InstalledAppFlow.from_client_secrets_file(
                         self.oauth2_credentials_file, scopes
                     )
                     credentials = flow.run_local_server(port=0)
                     logger.info("Authentication successful")
                 
                 # Save credentials for future use
-                with open(token_file, 'wb') as token:
-                    pickle.dump(credentials, token)
+                with open(token_file, 'w', buffering=TOKEN_BUFFER_SIZE) as token:
+                    token.write(credentials.to_json())
                     logger.info("Credentials saved for future use")
             else:
                 logger.info("Using saved credentials")
             
+            # Reuse one keep-alive connection for every API call
+            authed_http = google_auth_httplib2.AuthorizedHttp(
+                credentials, http=httplib2.Http(cache=HTTP_CACHE_DIR, timeout=HTTP_TIMEOUT)
+            )
             self.youtube = googleapiclient.discovery.build(
-                "youtube", "v3", credentials=credentials
+                "youtube", "v3", http=authed_http, static_discovery=True
             )
             
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
             raise
     
+    def _load_stream_map_cache(self) -> Optional[Dict[str, Dict]]:
+        """Return the cached stream mapping if it is fresh and matches this channel/campus"""
+        if not self.stream_map_ttl or not os.path.exists(STREAM_MAP_CACHE_FILE):
+            return None
+        
+        try:
+            with open(STREAM_MAP_CACHE_FILE, 'r') as cache_file:
+                cache = json.load(cache_file)
+            
+            if cache.get('channel_id') != self.channel_id or cache.get('campus_name') != self.campus_name:
+                return None
+            if time.time() - float(cache['ts']) >= self.stream_map_ttl:
+                return None
+            
+            return {
+                letter: {"id": str(entry["id"]), "snippet": {"title": str(entry["title"])}}
+                for letter, entry in cache['map'].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # Any unreadable or malformed cache is a cache miss
+            logger.warning(f"Ignoring invalid stream map cache: {e!r}")
+            return None
+    
+    def _save_stream_map_cache(self):
+        """Persist the current stream mapping for later runs"""
+        cache = {
+            "ts": time.time(),
+            "channel_id": self.channel_id,
+            "campus_name": self.campus_name,
+            "map": {
+                letter: {"id": stream["id"], "title": stream.get('snippet', {}).get('title', '')}
+                for letter, stream in self.stream_mapping.items()
+            },
+        }
+        try:
+            with open(STREAM_MAP_CACHE_FILE, 'w') as cache_file:
+                json.dump(cache, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save stream map cache: {e}")
+    
+    def _invalidate_stream_map_cache(self):
+        """Delete the cached stream mapping so the next run fetches streams again"""
+        try:
+            os.remove(STREAM_MAP_CACHE_FILE)
+            logger.info("Cleared cached stream mapping; the next run will fetch streams from YouTube")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to clear stream map cache: {e}")
+    
     def fetch_existing_streams(self):
         """Fetch existing live streams from YouTube and auto-map them"""
+        cached_mapping = self._load_stream_map_cache()
+        missing = [letter for letter in self.enabled_service_names if letter not in (cached_mapping or {})]
+        if cached_mapping and missing:
+            logger.info(f"Cached stream mapping has no stream for service(s) {', '.join(missing)}, refreshing")
+        elif cached_mapping:
+            self.stream_mapping = cached_mapping
+            self.stream_mapping_cached = True
+            self.existing_streams = list(cached_mapping.values())
+            logger.info(f"Using cached stream mapping for services: {', '.join(sorted(cached_mapping))}")
+            return self.existing_streams
+        
         try:
             logger.info("Fetching existing live streams...")
-            response = self.youtube.liveStreams().list(
-                part="id,snippet",
-                maxResults=50,
-                mine=True
-    ).execute()
-
-            self.existing_streams = response.get("items", [])
+            self.existing_streams = []
+            page_token = None
+            while True:
+                response = self.youtube.liveStreams().list(
+                    part="id,snippet",
+                    maxResults=50,
+                    mine=True,
+                    pageToken=page_token,
+                    fields="items(id,snippet/title),nextPageToken"
+                ).execute()
+                self.existing_streams.extend(response.get("items", []))
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+            
             logger.info(f"Found {len(self.existing_streams)} existing streams")
             
             # Auto-detect and map streams based on naming pattern: "{CAMPUS_NAME} Stream {Letter}"
             self.stream_mapping = {}
-            expected_pattern = f"{self.campus_name} Stream "
+            self.stream_mapping_cached = False
             
             for stream in self.existing_streams:
                 title = stream.get('snippet', {}).get('title', '')
-                if title.startswith(expected_pattern):
-                    # Extract the letter (A, B, C, etc.)
-                    letter = title[len(expected_pattern):].strip()
-                    if len(letter) == 1 and letter.upper() in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-                        self.stream_mapping[letter.upper()] = stream
-                        logger.info(f"Auto-mapped service {letter.upper()} to stream: {title}")
+                match = self._stream_re.match(title)
+                if match:
+                    letter = match.group(1).upper()
+                    self.stream_mapping[letter] = stream
+                    logger.info(f"Auto-mapped service {letter} to stream: {title}")
             
             if not self.stream_mapping:
-                logger.warning(f"No streams found matching pattern '{expected_pattern}[A-H]'")
+                logger.warning(f"No streams found matching pattern '{self.campus_name} Stream [A-H]'")
+            else:
+                self._save_stream_map_cache()
             
             return self.existing_streams
             
@@ -270,9 +453,11 @@ class YouTubeStreamScheduler:
         logger.error(f"No stream found for service {service_id}. Expected stream name: '{self.campus_name} Stream {service_id}'")
         return None
     
-    def calculate_next_occurrence(self, day_of_week: int, hour: int, minute: int) -> datetime:
+    def calculate_next_occurrence(self, day_of_week: int, hour: int, minute: int,
+                                  now: Optional[datetime] = None) -> datetime:
         """Calculate the next occurrence of a specific day/time"""
-        now = datetime.now(self.timezone)
+        if now is None:
+            now = self._now
         
         # Calculate days until target day
         days_ahead = day_of_week - now.weekday()
@@ -298,19 +483,17 @@ class YouTubeStreamScheduler:
         dates = []
         
         if self.start_date and self.end_date:
-            # Week range mode: find all occurrences within range
-            current = self.start_date
-            while current <= self.end_date:
-                if current.weekday() == service.day_of_week:
-                    service_time = current.replace(
-                        hour=service.time_hour,
-                        minute=service.time_minute,
-                        second=0,
-                        microsecond=0
-                    )
-                    if self.start_date <= service_time <= self.end_date:
-                        dates.append(service_time)
-                current += timedelta(days=1)
+            # Week range mode: find the first occurrence, then step a week at a time
+            days_ahead = (service.day_of_week - self.start_date.weekday()) % 7
+            first = (self.start_date + timedelta(days=days_ahead)).replace(
+                hour=service.time_hour,
+                minute=service.time_minute,
+                second=0,
+                microsecond=0
+            )
+            if first <= self.end_date:
+                weeks_in_range = (self.end_date - first).days // 7 + 1
+                dates = [first + timedelta(weeks=i) for i in range(weeks_in_range)]
         else:
             # Default mode: next occurrence only
             next_date = self.calculate_next_occurrence(
@@ -324,93 +507,172 @@ class YouTubeStreamScheduler:
     
     def format_stream_title(self, service_datetime: datetime) -> str:
         """Format stream title with campus name and date/time"""
-        formatted = service_datetime.strftime('%m-%d-%Y // %I:%M %p')
-        return f"{self.campus_name} // {formatted}"
+        dt = service_datetime
+        # Equivalent to strftime('%m-%d-%Y // %I:%M %p') without parsing the format on every call
+        return (
+            f"{self.campus_name} // {dt.month:02d}-{dt.day:02d}-{dt.year} // "
+            f"{(dt.hour % 12 or 12):02d}:{dt.minute:02d} {'PM' if dt.hour >= 12 else 'AM'}"
+        )
     
-    def create_broadcast(self, service: ServiceConfig, scheduled_time: datetime) -> Optional[str]:
-        """Create a YouTube live broadcast"""
-        try:
+    def _build_insert_request(self, service: ServiceConfig, stream_title: str, scheduled_time: datetime):
+        """Build the liveBroadcasts.insert request for a service occurrence"""
+        return self.youtube.liveBroadcasts().insert(
+            part="snippet,status,contentDetails",
+            body={
+                "snippet": {
+                    "title": stream_title,
+                    "description": service.description,
+                    "scheduledStartTime": scheduled_time.isoformat(),
+                    "channelId": self.channel_id,
+                },
+                "status": self._status_tpl,
+                "contentDetails": self._content_details_tpl,
+            }
+        )
+    
+    def _build_bind_request(self, broadcast_id: str, stream: Dict):
+        """Build the liveBroadcasts.bind request tying a broadcast to its stream"""
+        return self.youtube.liveBroadcasts().bind(
+            part="id,contentDetails",
+            id=broadcast_id,
+            streamId=stream["id"],
+        )
+    
+    def _build_playlist_request(self, broadcast_id: str):
+        """Build the playlistItems.insert request adding a broadcast to the playlist"""
+        return self.youtube.playlistItems().insert(
+            part="snippet",
+            body={
+                "snippet": {
+                    **self._playlist_tpl_snippet,
+                    "resourceId": {**self._playlist_tpl_snippet["resourceId"], "videoId": broadcast_id},
+                },
+            },
+        )
+    
+    def _execute_batch(self, requests: List[Tuple[str, object]], callback):
+        """Execute (request_id, request) pairs as HTTP batches of at most MAX_BATCH_SIZE"""
+        for start in range(0, len(requests), self.MAX_BATCH_SIZE):
+            batch = self.youtube.new_batch_http_request(callback=callback)
+            for request_id, request in requests[start:start + self.MAX_BATCH_SIZE]:
+                batch.add(request, request_id=request_id)
+            batch.execute()
+    
+    def create_broadcasts(self, pending: List[Tuple[ServiceConfig, datetime]]) -> int:
+        """Create YouTube live broadcasts for (service, scheduled_time) pairs using batched requests"""
+        jobs = {}
+        inserts = []
+        
+        for service, scheduled_time in pending:
             stream = self.get_stream_by_service_id(service.service_id)
             if not stream:
                 logger.error(f"Stream not found for service {service.service_id} ({service.name})")
-                return None
+                continue
             
             stream_title = self.format_stream_title(scheduled_time)
-            scheduled_time_iso = scheduled_time.isoformat()
             
             if self.dry_run:
                 logger.info(f"[DRY RUN] Would create broadcast:")
                 logger.info(f"  Service: {service.service_id} - {service.name}")
                 logger.info(f"  Title: {stream_title}")
-                logger.info(f"  Time: {scheduled_time_iso}")
+                logger.info(f"  Time: {scheduled_time.isoformat()}")
                 logger.info(f"  Stream: {stream.get('snippet', {}).get('title', 'Unknown')}")
                 logger.info(f"  Description: {service.description or 'No description'}")
                 logger.info(f"  Auto-start: {self.auto_start}")
                 logger.info(f"  Auto-stop: {self.auto_stop}")
                 logger.info(f"  DVR enabled: {self.enable_dvr}")
                 logger.info(f"  360° video: {self.enable_360}")
-                return None
+                continue
             
-            # Create live broadcast
-            live_broadcast = self.youtube.liveBroadcasts().insert(
-                part="snippet,status,contentDetails",
-                body={
-                    "snippet": {
-                        "title": stream_title,
-                        "description": service.description,
-                        "scheduledStartTime": scheduled_time_iso,
-                        "channelId": self.channel_id,
-                    },
-                    "status": {
-                        "privacyStatus": self.privacy_status,
-                        "selfDeclaredMadeForKids": self.made_for_kids,
-                    },
-                    "contentDetails": {
-                        "enableAutoStart": self.auto_start,
-                        "enableAutoStop": self.auto_stop,
-                        "enableDvr": self.enable_dvr,
-                        "projection": "360" if self.enable_360 else "rectangular",
-                    }
-                }
-            ).execute()
-
-            broadcast_id = live_broadcast["id"]
-            logger.info(f"Created broadcast {broadcast_id}: {stream_title}")
-            
-            # Bind the broadcast to the stream
-            self.youtube.liveBroadcasts().bind(
-        part="id,contentDetails",
-                id=broadcast_id,
-                streamId=stream["id"],
-    ).execute()
-
-            logger.info(f"Bound broadcast to stream: {stream.get('snippet', {}).get('title', 'Unknown')}")
-            
-            # Add to playlist
-            self.youtube.playlistItems().insert(
-        part="snippet",
-        body={
-            "snippet": {
-                        "playlistId": self.playlist_id,
-                "position": 0,
-                "resourceId": {
-                    "kind": "youtube#video",
-                            "videoId": broadcast_id,
-                },
-            },
-        },
-    ).execute()
-
-            logger.info(f"Added broadcast to playlist")
+            job_id = str(len(jobs))
+            jobs[job_id] = (service, stream, stream_title)
+            inserts.append((job_id, self._build_insert_request(service, stream_title, scheduled_time)))
+        
+        if not jobs:
+            return 0
+        
+        created = {}  # job id -> broadcast id
+        completed = {}  # job id -> follow-up steps ('bind', 'playlist') that succeeded
+        failure_messages = {
+            'bind': "Failed to bind broadcast {} to its stream",
+            'playlist': "Failed to add broadcast {} to playlist",
+        }
+        
+        def on_insert(job_id, response, exception):
+            service, _, stream_title = jobs[job_id]
+            if exception is not None:
+                logger.error(f"Failed to create broadcast for service {service.service_id} ({service.name}): {exception}")
+                return
+            created[job_id] = response["id"]
+            completed[job_id] = set()
+            logger.info(f"Created broadcast {response['id']}: {stream_title}")
+        
+        def on_bind(job_id, response, exception):
+            service, stream, _ = jobs[job_id]
+            if exception is not None:
+                logger.error(f"{failure_messages['bind'].format(created[job_id])} for service {service.service_id} ({service.name}): {exception}")
+                if self.stream_mapping_cached:
+                    # The cached stream id may belong to a deleted or recreated stream key
+                    self._invalidate_stream_map_cache()
+                    self.stream_mapping_cached = False
+                return
+            completed[job_id].add('bind')
+            logger.info(f"Bound broadcast {created[job_id]} to stream: {stream.get('snippet', {}).get('title', 'Unknown')}")
+        
+        try:
+            # Create every broadcast first; bind and playlist calls need the returned IDs
+            self._execute_batch(inserts, on_insert)
             
-            return broadcast_id
+            binds = []
+            for job_id, broadcast_id in created.items():
+                _, stream, _ = jobs[job_id]
+                binds.append((job_id, self._build_bind_request(broadcast_id, stream)))
+            
+            self._execute_batch(binds, on_bind)
+            
+            # Playlist inserts go one at a time in scheduling order: batched sub-requests may
+            # run in any order, and concurrent writes to one playlist fail intermittently
+            for job_id in jobs:
+                if job_id not in created:
+                    continue
+                service, _, _ = jobs[job_id]
+                try:
+                    self._build_playlist_request(created[job_id]).execute()
+                except googleapiclient.errors.HttpError as e:
+                    logger.error(f"{failure_messages['playlist'].format(created[job_id])} for service {service.service_id} ({service.name}): {e}")
+                    continue
+                completed[job_id].add('playlist')
+                logger.info(f"Added broadcast {created[job_id]} to playlist")
             
         except googleapiclient.errors.HttpError as e:
-            logger.error(f"Failed to create broadcast for service {service.service_id} ({service.name}): {e}")
-            return None
+            logger.error(f"Batch request failed: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error creating broadcast for service {service.service_id} ({service.name}): {e}")
-            return None
+            logger.error(f"Unexpected error creating broadcasts: {e}")
+        
+        # Only broadcasts that were created, bound and added to the playlist count as created
+        incomplete = [created[job_id] for job_id, steps in completed.items() if steps != set(failure_messages)]
+        if incomplete:
+            logger.warning(f"{len(incomplete)} broadcast(s) were created but not fully set up: {', '.join(incomplete)}. "
+                           f"Delete them in YouTube Studio and run again to recreate them.")
+        
+        return len(completed) - len(incomplete)
+    
+    def _list_upcoming_broadcasts(self) -> List[Dict]:
+        """Fetch every upcoming broadcast, following pagination"""
+        broadcasts = []
+        page_token = None
+        while True:
+            response = self.youtube.liveBroadcasts().list(
+                part="id,snippet,contentDetails",
+                broadcastStatus="upcoming",
+                maxResults=50,
+                pageToken=page_token,
+                fields="items(id,snippet(title,scheduledStartTime),contentDetails/boundStreamId),nextPageToken"
+            ).execute()
+            broadcasts.extend(response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return broadcasts
     
     def remove_all_scheduled_broadcasts(self):
         """Remove all scheduled/upcoming broadcasts"""
@@ -418,13 +680,7 @@ class YouTubeStreamScheduler:
             logger.info("Fetching all scheduled broadcasts...")
             
             # Fetch all upcoming broadcasts
-            response = self.youtube.liveBroadcasts().list(
-                part="id,snippet,status",
-                broadcastStatus="upcoming",
-                maxResults=50
-            ).execute()
-            
-            broadcasts = response.get("items", [])
+            broadcasts = self._list_upcoming_broadcasts()
             
             if not broadcasts:
                 logger.info("No scheduled broadcasts found to remove.")
@@ -441,56 +697,41 @@ class YouTubeStreamScheduler:
                     logger.info(f"  - {title} @ {scheduled_time} (ID: {broadcast_id})")
                 return len(broadcasts)
             
-            # Delete each broadcast
-            deleted_count = 0
-            for broadcast in broadcasts:
-                broadcast_id = broadcast.get('id')
-                title = broadcast.get('snippet', {}).get('title', 'Unknown')
-                
-                try:
-                    self.youtube.liveBroadcasts().delete(id=broadcast_id).execute()
-                    logger.info(f"Deleted: {title} (ID: {broadcast_id})")
-                    deleted_count += 1
-                except googleapiclient.errors.HttpError as e:
-                    logger.error(f"Failed to delete broadcast {broadcast_id}: {e}")
+            # Delete all broadcasts in batched requests
+            titles = {broadcast.get('id'): broadcast.get('snippet', {}).get('title', 'Unknown') for broadcast in broadcasts}
+            deleted = []
+            
+            def on_delete(broadcast_id, response, exception):
+                if exception is not None:
+                    logger.error(f"Failed to delete broadcast {broadcast_id}: {exception}")
+                    return
+                deleted.append(broadcast_id)
+                logger.info(f"Deleted: {titles[broadcast_id]} (ID: {broadcast_id})")
+            
+            try:
+                self._execute_batch(
+                    [(broadcast_id, self.youtube.liveBroadcasts().delete(id=broadcast_id)) for broadcast_id in titles],
+                    on_delete
+                )
+            except googleapiclient.errors.HttpError as e:
+                logger.error(f"Failed to delete broadcasts: {e}")
             
-            logger.info(f"Successfully deleted {deleted_count} broadcast(s)")
-            return deleted_count
+            logger.info(f"Successfully deleted {len(deleted)} broadcast(s)")
+            return len(deleted)
             
         except googleapiclient.errors.HttpError as e:
             logger.error(f"Failed to fetch broadcasts: {e}")
             raise
     
-    def run(self):
-        """Main execution flow"""
-        logger.info("YouTube Stream Scheduler Starting...")
-        
-        if self.dry_run:
-            logger.info("Running in DRY RUN mode - no broadcasts will be created")
-        
-        # Validate configuration
-        if not self.validate_config():
-            logger.error("Configuration validation failed. Please check your .env file")
-            sys.exit(1)
-        
-        # Authenticate
-        self.authenticate()
-        
-        # Fetch existing streams
-        self.fetch_existing_streams()
-        
-        if not self.existing_streams:
-            logger.error("No existing stream keys found. Please set up stream keys in YouTube first.")
-            sys.exit(1)
-        
+    def _collect_pending(self) -> List[Tuple[ServiceConfig, datetime]]:
+        """Collect every (service, date) pair for the run, soonest first"""
         # Determine mode
         if self.start_date and self.end_date:
             logger.info(f"Scheduling services from {self.start_date.date()} to {self.end_date.date()}")
         else:
             logger.info("Scheduling next occurrence of each service")
         
-        # Process each enabled service
-        total_created = 0
+        pending = []
         for service_id in self.enabled_service_names:
             logger.info(f"\n--- Processing Service {service_id} ---")
             
@@ -511,11 +752,204 @@ class YouTubeStreamScheduler:
             
             for date in dates:
                 logger.info(f"Scheduling for {date}")
-                broadcast_id = self.create_broadcast(service, date)
-                if broadcast_id:
-                    total_created += 1
+                pending.append((service, date))
+        
+        # Soonest broadcasts first, so an interrupted run has still scheduled the next services
+        pending.sort(key=lambda item: item[1])
+        return pending
+    
+    def _skip_already_scheduled(self, pending: List[Tuple[ServiceConfig, datetime]],
+                                upcoming: List[Dict]) -> List[Tuple[ServiceConfig, datetime]]:
+        """Drop pending occurrences that already have a bound broadcast with the same title and start time"""
+        scheduled = set()
+        unbound = {}  # (start time, title) -> broadcast id left half set up by an earlier run
+        for broadcast in upcoming:
+            snippet = broadcast.get('snippet', {})
+            start_time = snippet.get('scheduledStartTime')
+            if start_time:
+                # The API reports UTC with a 'Z' suffix; compare as aware datetimes
+                try:
+                    key = (datetime.fromisoformat(start_time.replace('Z', '+00:00')), snippet.get('title'))
+                except ValueError:
+                    logger.warning(f"Ignoring broadcast {broadcast.get('id')} with unparseable start time: {start_time}")
+                    continue
+                if broadcast.get('contentDetails', {}).get('boundStreamId'):
+                    scheduled.add(key)
+                else:
+                    unbound[key] = broadcast.get('id')
+        
+        remaining = []
+        for service, date in pending:
+            stream_title = self.format_stream_title(date)
+            key = (date, stream_title)
+            if key in scheduled:
+                logger.info(f"Already scheduled, skipping: {stream_title}")
+                continue
+            if key in unbound:
+                logger.warning(f"Existing broadcast {unbound[key]} for {stream_title} is not bound to a stream; "
+                               f"scheduling a replacement (delete the old one in YouTube Studio)")
+            remaining.append((service, date))
+        return remaining
+    
+    def run(self) -> int:
+        """Main execution flow"""
+        logger.info("YouTube Stream Scheduler Starting...")
+        
+        if self.dry_run:
+            logger.info("Running in DRY RUN mode - no broadcasts will be created")
+        
+        # Validate configuration
+        if not self.validate_config():
+            logger.error("Configuration validation failed. Please check your .env file")
+            sys.exit(1)
+        
+        # Authenticate (already done when running as a daemon)
+        if self.youtube is None:
+            self.authenticate()
+        
+        # Fetch existing streams
+        self.fetch_existing_streams()
+        
+        if not self.existing_streams:
+            logger.error("No existing stream keys found. Please set up stream keys in YouTube first.")
+            sys.exit(1)
+        
+        pending = self._collect_pending()
+        
+        # Skipping existing broadcasts is only an optimisation, so a failed lookup schedules everything
+        try:
+            upcoming = self._list_upcoming_broadcasts()
+        except googleapiclient.errors.HttpError as e:
+            logger.warning(f"Failed to fetch scheduled broadcasts, not skipping existing ones: {e}")
+            upcoming = []
+        pending = self._skip_already_scheduled(pending, upcoming)
+        
+        # Create all broadcasts in batched requests
+        total_created = self.create_broadcasts(pending)
         
         logger.info(f"\n{'[DRY RUN] ' if self.dry_run else ''}Completed! {total_created} broadcast(s) {'would be ' if self.dry_run else ''}created.")
+        return total_created
+
+
+class StaleConfigError(Exception):
+    """Raised when a client's configuration differs from the daemon's startup configuration"""
+
+
+class SchedulerDaemon:
+    """Keeps one authenticated scheduler resident for commands received over a unix socket"""
+    
+    def __init__(self):
+        self.scheduler = YouTubeStreamScheduler()
+        if not self.scheduler.validate_config():
+            logger.error("Configuration validation failed. Please check your .env file")
+            sys.exit(1)
+        
+        # Dry runs are always executed by the client so the preview is printed where it was requested
+        if self.scheduler.dry_run:
+            logger.warning("DRY_RUN is ignored by the daemon; dry runs are executed in-process by the client")
+            self.scheduler.dry_run = False
+        
+        self.scheduler.authenticate()
+    
+    def execute(self, command: Dict) -> int:
+        """Run a 'schedule' or 'remove' command against the resident scheduler"""
+        action = command.get('command')
+        if command.get('config') != self.scheduler.config_fingerprint:
+            raise StaleConfigError("Configuration differs from the daemon's startup configuration")
+        
+        if action == 'schedule':
+            self.scheduler.set_weeks(command.get('weeks'))
+            return self.scheduler.run()
+        if action == 'remove':
+            return self.scheduler.remove_all_scheduled_broadcasts()
+        raise ValueError(f"Unknown command: {action}")
+
+
+class SchedulerRequestHandler(socketserver.StreamRequestHandler):
+    """Handle one JSON command from a client connected to the daemon socket"""
+    
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # Connection probe (e.g. another --serve checking for a live daemon)
+            return
+        try:
+            command = json.loads(line)
+            result = {'ok': True, 'count': self.server.scheduler_daemon.execute(command)}
+        except StaleConfigError as e:
+            result = {'ok': False, 'stale_config': True, 'error': str(e)}
+        except SystemExit:
+            result = {'ok': False, 'error': 'Command failed, see daemon log for details'}
+        except Exception as e:
+            logger.error(f"Daemon command failed: {e}")
+            result = {'ok': False, 'error': str(e)}
+        self.wfile.write(json.dumps(result).encode() + b'\n')
+
+
+def serve(socket_path: str):
+    """Run the scheduler as a daemon listening on a unix socket"""
+    if not hasattr(socket, 'AF_UNIX'):
+        logger.error("Daemon mode requires unix socket support")
+        sys.exit(1)
+    
+    # Remove a stale socket left behind by a previous daemon, but never a live one
+    if os.path.exists(socket_path):
+        if _daemon_listening(socket_path):
+            logger.error(f"A scheduler daemon is already listening on {socket_path}")
+            sys.exit(1)
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            logger.error(f"{socket_path} exists and is not a socket")
+            sys.exit(1)
+        os.remove(socket_path)
+    
+    scheduler_daemon = SchedulerDaemon()
+    
+    with socketserver.UnixStreamServer(socket_path, SchedulerRequestHandler) as server:
+        server.scheduler_daemon = scheduler_daemon
+        logger.info(f"Scheduler daemon listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Scheduler daemon stopping")
+        finally:
+            os.remove(socket_path)
+
+
+def _daemon_listening(socket_path: str) -> bool:
+    """Check whether something accepts connections on the socket"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(DAEMON_CONNECT_TIMEOUT)
+            probe.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+def send_command(socket_path: str, command: Dict) -> Optional[Dict]:
+    """Send a command to a running daemon, returning None if no daemon is reachable"""
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+        return None
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.settimeout(DAEMON_CONNECT_TIMEOUT)
+            client.connect(socket_path)
+        except OSError as e:
+            logger.warning(f"Scheduler daemon unavailable ({e}), running in-process")
+            return None
+        
+        # Once the command is sent the daemon may already be acting on it, so
+        # failures from here on are reported rather than retried in-process
+        try:
+            client.settimeout(DAEMON_REPLY_TIMEOUT)
+            client.sendall(json.dumps(command).encode() + b'\n')
+            reply = client.makefile('rb').readline()
+            if not reply:
+                raise ValueError("connection closed without a reply")
+            return json.loads(reply)
+        except (OSError, ValueError) as e:
+            return {'ok': False, 'error': f"No valid reply from daemon ({e}); check the daemon log before retrying"}
 
 
 def main():
@@ -531,6 +965,7 @@ Examples:
   %(prog)s -w 1 --dry-run     # Preview 1 week without creating broadcasts
   %(prog)s --remove           # Remove all scheduled broadcasts
   %(prog)s --remove --dry-run # Preview what would be removed
+  %(prog)s --serve            # Run as a daemon keeping credentials in memory
         '''
     )
     
@@ -553,8 +988,43 @@ Examples:
         help='Preview what would be created/removed without making actual changes'
     )
     
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run as a daemon on a unix socket; later invocations are forwarded to it'
+    )
+    
     args = parser.parse_args()
     
+    # Load environment variables
+    _load_env_once()
+    
+    socket_path = os.getenv('SCHEDULER_SOCKET', DEFAULT_SOCKET_PATH)
+    
+    if args.serve:
+        serve(socket_path)
+        return
+    
+    # Forward to a running daemon if there is one. Dry runs stay in-process so the
+    # preview is printed here rather than in the daemon's log.
+    dry_run = args.dry_run or os.getenv('DRY_RUN', 'false').lower() == 'true'
+    command = {
+        'command': 'remove' if args.remove else 'schedule',
+        'weeks': args.weeks,
+        'config': config_fingerprint(os.environ),
+    }
+    result = None if dry_run else send_command(socket_path, command)
+    if result is not None and result.get('stale_config'):
+        logger.warning("Scheduler daemon was started with a different configuration, running in-process. "
+                       "Restart the daemon to pick up configuration changes.")
+        result = None
+    if result is not None:
+        if not result.get('ok'):
+            logger.error(f"Scheduler daemon error: {result.get('error')}")
+            sys.exit(1)
+        logger.info(f"Scheduler daemon processed {result.get('count', 0)} broadcast(s)")
+        return
+    
     # Override dry-run setting if specified on command line
     if args.dry_run:
         os.environ['DRY_RUN'] = 'true'